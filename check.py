@@ -1,37 +1,45 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import math
 import time
 import os
-import subprocess
-from datetime import datetime
+import shutil
+import sys
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+# orjson parses Helix responses faster, fall back to the standard library
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+def _parse_env_line(line):
+    """Split a KEY=VALUE line into a stripped key and unquoted value"""
+    key, _, value = line.partition('=')
+    value = value.strip()
+    
+    # Remove quotes if present
+    if value[:1] in ('"', "'") and value[-1:] == value[:1]:
+        value = value[1:-1]
+    return key.strip(), value
 
 def load_env_file(filepath='.env'):
     """Simple .env file parser that doesn't require external dependencies"""
-    env_vars = {}
-    if not os.path.exists(filepath):
-        return env_vars
-    
-    with open(filepath, 'r') as f:
-        for line in f:
-            line = line.strip()
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-            
-            # Parse KEY=VALUE format
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-                
-                env_vars[key] = value
+    path = Path(filepath)
+    if not path.exists():
+        return {}
     
-    return env_vars
+    # Skip empty lines, comments and lines without KEY=VALUE format
+    pairs = (_parse_env_line(line) for line in path.read_text().splitlines()
+             if '=' in line and not line.lstrip().startswith('#'))
+    return {key: value for key, value in pairs if key}
 
 # Load environment variables from .env file
 env_vars = load_env_file()
@@ -44,35 +52,86 @@ STREAMER_NAMES = (env_vars.get("TWITCH_STREAMER_NAMES") or os.environ.get("TWITC
 # Clean up streamer names (remove whitespace)
 STREAMER_NAMES = [name.strip() for name in STREAMER_NAMES if name.strip()]
 
+# (display name, lowercase login) pairs, computed once since names never change
+NAME_PAIRS = tuple((name, name.lower()) for name in STREAMER_NAMES)
+
 # Check interval in seconds
 CHECK_INTERVAL = int(env_vars.get("CHECK_INTERVAL") or os.environ.get("CHECK_INTERVAL", "60"))
 
-# Color functions using tput
-def tput(command):
-    """Execute tput command and return the result"""
-    try:
-        result = subprocess.check_output(['tput'] + command.split())
-        return result.decode('utf-8')
-    except:
-        return ''
+# Format of the Last Update timestamp
+TIMESTAMP_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Seconds between countdown updates
+COUNTDOWN_TICK = 0.5
+
+# Start fetching the next status this many seconds before the countdown ends
+PREFETCH_SECONDS = 3
+
+# Helix accepts at most this many user_login parameters per request
+MAX_LOGINS_PER_REQUEST = 100
+
+# Concurrent chunk requests, kept within the session's connection pool size
+MAX_FETCH_WORKERS = 4
+
+# Refresh the OAuth token this many seconds before it actually expires
+TOKEN_EXPIRY_BUFFER = 300
+
+# Shared HTTP session so polls reuse the keep-alive connection to Twitch
+SESSION = requests.Session()
+SESSION.headers.update({"Connection": "keep-alive"})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=MAX_FETCH_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])))
 
-# Initialize colors using tput
+def enable_windows_ansi():
+    """Turn on ANSI escape processing for the Windows console"""
+    if os.name != 'nt':
+        return
+    import ctypes
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = ctypes.c_uint32()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+
+enable_windows_ansi()
+
+# Only emit ANSI escape codes when writing to a terminal
+USE_COLOR = sys.stdout.isatty()
+
+def ansi(code):
+    """Return the ANSI escape sequence for an SGR code, or '' when not a terminal"""
+    return "\033[{0}m".format(code) if USE_COLOR else ''
+
+# Same sequences tput emits for sgr0, bold and setaf on ANSI terminals
 class Colors:
-    RESET = tput('sgr0')
-    BOLD = tput('bold')
+    RESET = ansi(0)
+    BOLD = ansi(1)
     
     # Colors using setaf (set ANSI foreground)
-    RED = tput('setaf 1')
-    GREEN = tput('setaf 2')
-    YELLOW = tput('setaf 3')
-    BLUE = tput('setaf 4')
-    MAGENTA = tput('setaf 5')
-    CYAN = tput('setaf 6')
-    WHITE = tput('setaf 7')
+    RED = ansi(31)
+    GREEN = ansi(32)
+    YELLOW = ansi(33)
+    CYAN = ansi(36)
+
+# Static panel strings, built once instead of on every render
+PANEL_WIDTH = 78
+HEADER_RULE = "{0}{1}{2}{3}".format(Colors.BOLD, Colors.CYAN, '=' * PANEL_WIDTH, Colors.RESET)
+HEADER_TITLE = "{0}{1}{2:^{3}}{4}".format(Colors.BOLD, Colors.CYAN, 'TWITCH STREAM MONITOR', PANEL_WIDTH, Colors.RESET)
+LIVE_HEADER = "{0}{1}  * LIVE STREAMS{2}".format(Colors.BOLD, Colors.GREEN, Colors.RESET)
+LIVE_RULE = "{0}  {1}{2}".format(Colors.GREEN, '-' * 76, Colors.RESET)
+OFFLINE_HEADER = "{0}{1}  o OFFLINE{2}".format(Colors.BOLD, Colors.RED, Colors.RESET)
+OFFLINE_RULE = "{0}  {1}{2}".format(Colors.RED, '-' * 76, Colors.RESET)
+FOOTER_RULE = "  {0}".format('-' * 76)
+COUNTDOWN_FMT = "\r  Next check in {0}{{0}}{1} seconds... (Press Ctrl+C to exit){1}   ".format(
+    Colors.YELLOW, Colors.RESET)
 
 def clear_screen():
-    """Clear the terminal screen"""
-    os.system('clear' if os.name != 'nt' else 'cls')
+    """Clear the terminal screen and move the cursor home"""
+    sys.stdout.write("\033[2J\033[H")
+    sys.stdout.flush()
 
 def validate_config():
     """Validate that all required environment variables are set"""
@@ -83,8 +142,12 @@ def validate_config():
     if not STREAMER_NAMES:
         raise ValueError("TWITCH_STREAMER_NAMES environment variable is not set or empty")
 
+# Cached OAuth token and the monotonic time after which it must be refreshed
+_token_cache = {"token": None, "expires_at": 0}
+_token_lock = threading.Lock()
+
 def get_oauth_token():
-    """Get OAuth token for Twitch API"""
+    """Get OAuth token for Twitch API, returned as (token, expires_at)"""
     url = "https://id.twitch.tv/oauth2/token"
     params = {
         "client_id": CLIENT_ID,
@@ -92,113 +155,231 @@ def get_oauth_token():
         "grant_type": "client_credentials"
     }
     
-    response = requests.post(url, params=params)
+    response = SESSION.post(url, params=params, timeout=10)
     if response.status_code == 200:
-        return response.json()["access_token"]
+        data = response.json()
+        expires_at = time.monotonic() + data["expires_in"] - TOKEN_EXPIRY_BUFFER
+        return data["access_token"], expires_at
     else:
         raise Exception("Failed to get OAuth token: {0}".format(response.status_code))
 
-def check_multiple_streamers(streamer_names, access_token):
-    """Check if multiple streamers are currently live (up to 100 at once)"""
+def get_access_token(rejected_token=None):
+    """Return the cached OAuth token, fetching a new one if missing, near expiry or rejected
+
+    rejected_token is the token that just got a 401, it is only replaced if no
+    other thread has refreshed it already.
+    """
+    with _token_lock:
+        if (time.monotonic() >= _token_cache["expires_at"]
+                or (rejected_token is not None and rejected_token == _token_cache["token"])):
+            _token_cache["token"], _token_cache["expires_at"] = get_oauth_token()
+        return _token_cache["token"]
+
+def get_streams(params, access_token):
+    """Request stream info from the Helix streams endpoint"""
     url = "https://api.twitch.tv/helix/streams"
     headers = {
         "Client-ID": CLIENT_ID,
         "Authorization": "Bearer {0}".format(access_token)
     }
+    return SESSION.get(url, headers=headers, params=params, timeout=10)
+
+class StreamStatus(NamedTuple):
+    """Live status of a single streamer"""
+    is_live: bool
+    title: str = ""
+    game: str = ""
+    viewer_count: int = 0
+    started_at: str = ""
+
+# Shared status for every offline streamer
+OFFLINE_STATUS = StreamStatus(is_live=False)
+
+def fetch_live_streams(name_pairs):
+    """Get live stream info for up to 100 streamers, keyed by lowercase login"""
+    # API allows up to 100 user_login parameters, and returns 20 streams unless told otherwise
+    params = [("user_login", name_lower) for _, name_lower in name_pairs]
+    params.append(("first", MAX_LOGINS_PER_REQUEST))
     
-    # API allows up to 100 user_login parameters
-    params = [("user_login", name) for name in streamer_names]
+    access_token = get_access_token()
+    response = get_streams(params, access_token)
     
-    response = requests.get(url, headers=headers, params=params)
+    # Token was revoked or expired early, refresh it and retry once
+    if response.status_code == 401:
+        response = get_streams(params, get_access_token(rejected_token=access_token))
     
     if response.status_code == 200:
-        data = response.json()
+        data = _loads(response.content)
         
         # Create a dictionary of live streamers
         live_streamers = {}
         for stream_info in data["data"]:
-            live_streamers[stream_info["user_login"].lower()] = {
-                "is_live": True,
-                "title": stream_info["title"],
-                "game": stream_info["game_name"],
-                "viewer_count": stream_info["viewer_count"],
-                "started_at": stream_info["started_at"]
-            }
-        
-        # Add offline status for streamers not in the response
-        result = {}
-        for name in streamer_names:
-            name_lower = name.lower()
-            if name_lower in live_streamers:
-                result[name] = live_streamers[name_lower]
-            else:
-                result[name] = {"is_live": False}
-        
-        return result
+            live_streamers[stream_info["user_login"].lower()] = StreamStatus(
+                is_live=True,
+                title=stream_info["title"],
+                game=stream_info["game_name"],
+                viewer_count=stream_info["viewer_count"],
+                started_at=stream_info["started_at"]
+            )
+        return live_streamers
     else:
         raise Exception("API request failed: {0}".format(response.status_code))
 
+def run_in_background(func, *args):
+    """Run func on a daemon thread and return a Future for its result
+
+    Daemon threads don't hold up interpreter exit, so Ctrl+C never waits on
+    an in-flight request.
+    """
+    future = Future()
+    
+    def run():
+        try:
+            future.set_result(func(*args))
+        except Exception as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+# Caps concurrent chunk requests at the session's connection pool size
+_fetch_slots = threading.BoundedSemaphore(MAX_FETCH_WORKERS)
+
+def fetch_chunk(name_pairs):
+    """Fetch one chunk of streamers, waiting for a free request slot"""
+    with _fetch_slots:
+        return fetch_live_streams(name_pairs)
+
+def check_multiple_streamers(name_pairs):
+    """Check if multiple streamers are currently live, fetching 100 at a time concurrently"""
+    chunks = [name_pairs[i:i + MAX_LOGINS_PER_REQUEST]
+              for i in range(0, len(name_pairs), MAX_LOGINS_PER_REQUEST)]
+    
+    # A single chunk needs no extra threads, otherwise merge live streamers from every chunk
+    if len(chunks) == 1:
+        live_streamers = fetch_live_streams(chunks[0])
+    else:
+        futures = [run_in_background(fetch_chunk, chunk) for chunk in chunks]
+        live_streamers = {}
+        for future in futures:
+            live_streamers.update(future.result())
+    
+    # Add offline status for streamers not in the response
+    result = {}
+    for name, name_lower in name_pairs:
+        result[name] = live_streamers.get(name_lower, OFFLINE_STATUS)
+    
+    return result
+
+def fetch_statuses(name_pairs):
+    """Check streamers, returned as (statuses, timestamp) of when the check ran"""
+    timestamp = time.strftime(TIMESTAMP_FMT)
+    return check_multiple_streamers(name_pairs), timestamp
+
+@lru_cache(maxsize=512)
 def format_viewer_count(count):
     """Format viewer count with K for thousands"""
     if count >= 1000:
         return "{0:.1f}K".format(count/1000)
     return str(count)
 
-def display_status(statuses, last_update, seconds_remaining):
-    """Display streamers in a nice visual format"""
+@lru_cache(maxsize=512)
+def truncate(text, length):
+    """Shorten text to length characters, adding ... when cut"""
+    return text[:length] + "..." if len(text) > length else text
+
+# Terminal row of the Last Update line in the panel drawn by render_panel
+LAST_UPDATE_ROW = 6
+
+def render_panel(statuses, last_update):
+    """Display streamers in a nice visual format, drawn once per poll
+
+    Returns (lines, width), the number of lines written and the widest of them.
+    """
     clear_screen()
+    out = []
+    width = PANEL_WIDTH
     
     # Header
-    print("{0}{1}{2}{3}".format(Colors.BOLD, Colors.CYAN, '=' * 78, Colors.RESET))
-    print("{0}{1}{2:^78}{3}".format(Colors.BOLD, Colors.CYAN, 'TWITCH STREAM MONITOR', Colors.RESET))
-    print("{0}{1}{2}{3}".format(Colors.BOLD, Colors.CYAN, '=' * 78, Colors.RESET))
-    print()
+    out.append(HEADER_RULE)
+    out.append(HEADER_TITLE)
+    out.append(HEADER_RULE)
+    out.append("")
     
     # Sort streamers: live ones first, then offline
-    live_streamers = [(name, status) for name, status in statuses.items() if status["is_live"]]
-    offline_streamers = [(name, status) for name, status in statuses.items() if not status["is_live"]]
+    live_streamers, offline_streamers = [], []
+    for item in statuses.items():
+        (live_streamers if item[1].is_live else offline_streamers).append(item)
     
     # Count summary
     live_count = len(live_streamers)
-    total_count = len(statuses)
-    print("{0}  Status: {1}{2} LIVE{3}{0} / {4}{5} OFFLINE{3}{0} / {6} Total{3}".format(
-        Colors.BOLD, Colors.GREEN, live_count, Colors.RESET, Colors.RED, total_count - live_count, total_count))
-    print("  Last Update: {0}".format(last_update))
-    print()
+    offline_count = len(offline_streamers)
+    out.append("{0}  Status: {1}{2} LIVE{3}{0} / {4}{5} OFFLINE{3}{0} / {6} Total{3}".format(
+        Colors.BOLD, Colors.GREEN, live_count, Colors.RESET, Colors.RED, offline_count, live_count + offline_count))
+    # Must stay on LAST_UPDATE_ROW for update_header_only
+    out.append("  Last Update: {0}".format(last_update))
+    out.append("")
     
     # Display live streamers
     if live_streamers:
-        print("{0}{1}  * LIVE STREAMS{2}".format(Colors.BOLD, Colors.GREEN, Colors.RESET))
-        print("{0}  {1}{2}".format(Colors.GREEN, '-' * 76, Colors.RESET))
+        out.append(LIVE_HEADER)
+        out.append(LIVE_RULE)
         for name, status in live_streamers:
-            viewers = format_viewer_count(status["viewer_count"])
-            title = status["title"][:55] + "..." if len(status["title"]) > 55 else status["title"]
-            game = status["game"][:20] + "..." if len(status["game"]) > 20 else status["game"]
+            viewers = format_viewer_count(status.viewer_count)
+            title = truncate(status.title, 55)
+            game = truncate(status.game, 20)
             
-            print("{0}{1}  +-- {2}{3}".format(Colors.BOLD, Colors.GREEN, name.upper(), Colors.RESET))
-            print("{0}  |{1}   {2}Title:{1} {3}".format(Colors.GREEN, Colors.RESET, Colors.BOLD, title))
-            print("{0}  |{1}   {2}Game:{1} {3}{4}{1}".format(Colors.GREEN, Colors.RESET, Colors.BOLD, Colors.CYAN, game))
-            print("{0}  |{1}   {2}Viewers:{1} {3}{4}{1}".format(Colors.GREEN, Colors.RESET, Colors.BOLD, Colors.YELLOW, viewers))
-            print("{0}  {1}{2}".format(Colors.GREEN, '-' * 76, Colors.RESET))
-            print()
+            out.append("{0}{1}  +-- {2}{3}".format(Colors.BOLD, Colors.GREEN, name.upper(), Colors.RESET))
+            out.append("{0}  |{1}   {2}Title:{1} {3}".format(Colors.GREEN, Colors.RESET, Colors.BOLD, title))
+            out.append("{0}  |{1}   {2}Game:{1} {3}{4}{1}".format(Colors.GREEN, Colors.RESET, Colors.BOLD, Colors.CYAN, game))
+            out.append("{0}  |{1}   {2}Viewers:{1} {3}{4}{1}".format(Colors.GREEN, Colors.RESET, Colors.BOLD, Colors.YELLOW, viewers))
+            out.append(LIVE_RULE)
+            out.append("")
     
     # Display offline streamers
     if offline_streamers:
-        print("{0}{1}  o OFFLINE{2}".format(Colors.BOLD, Colors.RED, Colors.RESET))
-        print("{0}  {1}{2}".format(Colors.RED, '-' * 76, Colors.RESET))
+        out.append(OFFLINE_HEADER)
+        out.append(OFFLINE_RULE)
         
         # Display offline streamers in columns
         cols = 3
         for i in range(0, len(offline_streamers), cols):
             row = offline_streamers[i:i+cols]
             formatted_names = ["{0}  - {1:<22}{2}".format(Colors.RED, name, Colors.RESET) for name, _ in row]
-            print("".join(formatted_names))
-        print()
+            out.append("".join(formatted_names))
+            width = max(width, sum(4 + max(22, len(name)) for name, _ in row))
+        out.append("")
+    
+    # Footer, the countdown line below it is updated in place
+    out.append(FOOTER_RULE)
     
-    # Footer with countdown
-    print("  {0}".format('-' * 76))
-    print("  Next check in {0}{1}{2} seconds... (Press Ctrl+C to exit){2}".format(
-        Colors.YELLOW, seconds_remaining, Colors.RESET), end='\r')
+    # Emit the whole panel with a single write
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
+    return len(out), width
+
+def panel_fits(panel_lines, panel_width):
+    """Check the panel is neither scrolled nor wrapped, so Last Update is still on LAST_UPDATE_ROW"""
+    size = shutil.get_terminal_size()
+    # One extra row for the countdown line below the panel
+    return panel_lines < size.lines and panel_width <= size.columns
+
+def update_header_only(last_update):
+    """Rewrite the Last Update line in place, leaving the rest of the panel as is"""
+    # Save cursor, jump to the Last Update row, clear it, then restore cursor
+    sys.stdout.write("\033[s\033[{0};1H  Last Update: {1}\033[K\033[u".format(LAST_UPDATE_ROW, last_update))
+    sys.stdout.flush()
+
+def status_hash(statuses):
+    """Hash the displayed fields of each status to detect changes between polls"""
+    return hash(frozenset(
+        (name, status.is_live, status.title, status.game, status.viewer_count)
+        for name, status in statuses.items()))
+
+def render_countdown(seconds_remaining):
+    """Rewrite only the countdown line without redrawing the panel"""
+    sys.stdout.write(COUNTDOWN_FMT.format(seconds_remaining))
+    sys.stdout.flush()
 
 def main():
     try:
@@ -210,26 +391,51 @@ def main():
         print("Monitoring {0} streamers".format(len(STREAMER_NAMES)))
         
         # Get OAuth token
-        access_token = get_oauth_token()
+        get_access_token()
         print("{0}Successfully authenticated with Twitch API{1}".format(Colors.GREEN, Colors.RESET))
         time.sleep(2)
         
+        # Fetch in the background so the next request overlaps the countdown
+        pending = run_in_background(fetch_statuses, NAME_PAIRS)
+        prev_hash = None
+        panel_lines, panel_width = 0, 0
+        
         while True:
             try:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                statuses = check_multiple_streamers(STREAMER_NAMES, access_token)
+                # Clear pending first so a failed fetch is resubmitted below
+                future, pending = pending, None
+                statuses, timestamp = future.result()
+                
+                # Only repaint the full panel when something visible changed and
+                # the previous one is still laid out as drawn
+                current_hash = status_hash(statuses)
+                if current_hash == prev_hash and panel_fits(panel_lines, panel_width):
+                    update_header_only(timestamp)
+                else:
+                    panel_lines, panel_width = render_panel(statuses, timestamp)
+                prev_hash = current_hash
                 
-                # Countdown loop
-                for seconds_remaining in range(CHECK_INTERVAL, 0, -1):
-                    display_status(statuses, timestamp, seconds_remaining)
-                    time.sleep(1)
+                # Countdown against a fixed deadline so sleep overshoot doesn't accumulate
+                deadline = time.monotonic() + CHECK_INTERVAL
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    if pending is None and remaining <= PREFETCH_SECONDS:
+                        pending = run_in_background(fetch_statuses, NAME_PAIRS)
+                    render_countdown(math.ceil(remaining))
+                    time.sleep(min(COUNTDOWN_TICK, remaining))
                 
             except Exception as e:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                prev_hash = None
+                timestamp = time.strftime(TIMESTAMP_FMT)
                 clear_screen()
                 print("\n{0}[{1}] Error checking status: {2}{3}".format(Colors.RED, timestamp, e, Colors.RESET))
                 print("{0}Retrying in {1} seconds...{2}".format(Colors.YELLOW, CHECK_INTERVAL, Colors.RESET))
                 time.sleep(CHECK_INTERVAL)
+            
+            if pending is None:
+                pending = run_in_background(fetch_statuses, NAME_PAIRS)
                 
     except KeyboardInterrupt:
         clear_screen()